@@ -1,32 +1,75 @@
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Characters that make up the tree drawing in front of an entry name
+_TREE_CHARS = ' │├└─'
+
+# Box-drawing characters that only appear in tree format input
+_BOX_CHARS = frozenset('│├└─')
+
+# Matches the branch character (├ or └) that introduces an entry
+_BRANCH_RE = re.compile(r'[├└]')
+
+# Below this many files a thread pool costs more to set up than it saves
+_PARALLEL_FILE_THRESHOLD = 32
+
+@lru_cache(maxsize=4096)
+def _is_folder(name):
+    """
+    Treat a name as a folder if it ends with '/' or its last part has no extension.
+    Cached because scaffolds repeat names like __init__.py and README.md.
+    """
+    return name.endswith('/') or '.' not in name.rsplit('/', 1)[-1]
+
+def _input_lines(text_input):
+    """
+    Return the structure as a list of lines, trimmed as text_input.strip() would be.
+    Accepts either the pasted text or an already split list of lines.
+    """
+    if isinstance(text_input, str):
+        return text_input.strip().split('\n')
+    
+    lines = list(text_input)
+    start, end = 0, len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    
+    lines = lines[start:end]
+    if not lines:
+        return ['']
+    lines[0] = lines[0].lstrip()
+    lines[-1] = lines[-1].rstrip()
+    return lines
+
 def calculate_tree_depth(line):
     """
     Calculate depth based on the position of tree characters.
     Each level is indicated by 4 characters of indentation.
     """
     # Find the position of the first tree branch character (├ or └)
-    for i, char in enumerate(line):
-        if char in ['├', '└']:
-            # Depth = position / 4 (since each level is 4 chars)
-            return i // 4 + 1
+    branch = _BRANCH_RE.search(line)
+    if branch:
+        # Depth = position / 4 (since each level is 4 chars)
+        return branch.start() // 4 + 1
     
     # If no ├ or └ found, check if it's a continuation line (starts with │)
     if line.strip().startswith('│'):
         # Find the position after │
-        for i, char in enumerate(line):
-            if char not in ['│', ' ']:
-                return i // 4 + 1
+        rest = line.lstrip('│ ')
+        if rest:
+            return (len(line) - len(rest)) // 4 + 1
     
     # If line starts with text (root or direct child of root)
-    for i, char in enumerate(line):
-        if char not in [' ', '│', '├', '└', '─']:
-            if i == 0:
-                return 0  # Root
-            else:
-                return i // 4
+    rest = line.lstrip(_TREE_CHARS)
+    if rest:
+        # Text at position 0 is the root (depth 0)
+        return (len(line) - len(rest)) // 4
     
     return 0
 
@@ -34,18 +77,8 @@ def extract_clean_name(line):
     """
     Extract the clean name by removing all tree characters and dashes.
     """
-    # Remove trailing whitespace
-    cleaned = line.rstrip()
-    
-    # Find where the actual name starts (after tree characters)
-    name_start = 0
-    while name_start < len(cleaned) and cleaned[name_start] in [' ', '│', '├', '└', '─']:
-        name_start += 1
-    
-    if name_start >= len(cleaned):
-        return ""
-    
-    name = cleaned[name_start:]
+    # Remove trailing whitespace and the leading tree characters
+    name = line.rstrip().lstrip(_TREE_CHARS)
     
     # Remove any leading/trailing dashes or spaces
     name = name.strip('─ ')
@@ -55,14 +88,16 @@ def extract_clean_name(line):
 def parse_tree_structure_robust(text_input):
     """
     Robust parser for tree structures using proper depth calculation.
+    text_input may be the pasted text or a list of its lines.
     """
-    lines = text_input.strip().split('\n')
+    lines = _input_lines(text_input)
     
     # Find the root folder (first non-empty line without leading tree chars)
     root_name = None
     for line in lines:
-        if line.strip() and not any(c in line[0] for c in ['│', '├', '└', ' ']):
-            root_name = line.strip().rstrip('/')
+        stripped = line.strip()
+        if stripped and line[0] not in '│├└ ':
+            root_name = stripped.rstrip('/')
             break
     
     if not root_name:
@@ -80,14 +115,22 @@ def parse_tree_structure_robust(text_input):
     # Stack to track parent folders at each depth level
     # Each item: (depth, folder_path)
     folder_stack = [(0, f'/{root_name}/')]
+    root_line = f"{root_name}/"
+    
+    # Hot loop locals: bound methods and the current top of the stack
+    add_operation = operations.append
+    push_folder = folder_stack.append
+    pop_folder = folder_stack.pop
+    top_depth, parent_path = folder_stack[-1]
     
     # Process each line
     for line in lines:
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             continue
         
         # Skip the root line (already processed)
-        if line.strip() == root_name or line.strip() == f"{root_name}/":
+        if stripped == root_name or stripped == root_line:
             continue
         
         # Calculate depth
@@ -99,56 +142,135 @@ def parse_tree_structure_robust(text_input):
             continue
         
         # Check if it's a folder
-        is_folder = name.endswith('/') or ('.' not in name.split('/')[-1])
+        is_folder = _is_folder(name)
         clean_name = name.rstrip('/')
         
         # Find the correct parent based on depth
-        # Pop from stack until we find a parent at depth-1
-        while folder_stack and folder_stack[-1][0] >= depth:
-            folder_stack.pop()
+        # Pop from stack until we find a parent at depth-1,
+        # never popping the root so it stays the fallback parent
+        while top_depth >= depth and len(folder_stack) > 1:
+            pop_folder()
+            top_depth, parent_path = folder_stack[-1]
         
-        if not folder_stack:
-            # This shouldn't happen, but just in case
-            folder_stack = [(0, f'/{root_name}/')]
-        
-        # Get parent path
-        parent_depth, parent_path = folder_stack[-1]
-        
-        # Build the full path
-        if parent_path.endswith('/'):
-            full_path = f"{parent_path}{clean_name}"
-        else:
-            full_path = f"{parent_path}/{clean_name}"
+        # Build the full path (folder paths on the stack always end in '/')
+        full_path = parent_path + clean_name
         
         if is_folder:
             full_path = full_path.rstrip('/') + '/'
         
         # Add to operations
-        operation = {
+        add_operation({
             'action': 'CREATE_FOLDER' if is_folder else 'CREATE_FILE',
             'name': clean_name,
             'path': full_path,
             'parentPath': parent_path
-        }
-        operations.append(operation)
+        })
         
         # If it's a folder, push it onto the stack for its children
         if is_folder:
-            folder_stack.append((depth, full_path))
+            push_folder((depth, full_path))
+            top_depth, parent_path = depth, full_path
+    
+    return {
+        'structure': {'name': root_name, 'path': f'/{root_name}/', 'type': 'folder'},
+        'operations': operations
+    }
+
+def parse_path_list(text_input):
+    """
+    Parser for simple path lists (one path per line), e.g. 'project/src/main.py'.
+    Produces the same result shape as parse_tree_structure_robust. Entries
+    without a folder (e.g. a flat 'README.md') become files directly under
+    the base folder.
+    """
+    lines = _input_lines(text_input)
+    
+    root_name = None
+    operations = []
+    seen_paths = set()
+    
+    for line in lines:
+        entry = line.strip()
+        parts = [part for part in entry.split('/') if part]
+        if not parts:
+            continue
+        
+        # The root is the first top-level folder; a leading file can't be it
+        if root_name is None and (len(parts) > 1 or _is_folder(entry)):
+            root_name = parts[0]
+        
+        # Every part but the last is a folder; the last one is checked by name
+        parent_path = '/'
+        last = len(parts) - 1
+        for i, part in enumerate(parts):
+            is_folder = i < last or _is_folder(entry)
+            full_path = f"{parent_path}{part}/" if is_folder else f"{parent_path}{part}"
+            
+            if full_path not in seen_paths:
+                seen_paths.add(full_path)
+                operations.append({
+                    'action': 'CREATE_FOLDER' if is_folder else 'CREATE_FILE',
+                    'name': part,
+                    'path': full_path,
+                    'parentPath': parent_path
+                })
+            parent_path = full_path
+    
+    if not root_name:
+        root_name = "project"
     
     return {
         'structure': {'name': root_name, 'path': f'/{root_name}/', 'type': 'folder'},
         'operations': operations
     }
 
+def _pick_parser(text_input):
+    """
+    Pick the parser once by looking at the start of the input.
+    Plain path lists have no tree characters, no indentation and at least one
+    nested path. If the first line is a bare root folder, the nested paths must
+    also start with it; otherwise ('project/' followed by 'src/main.py') it is an
+    unindented tree listing. Anything else goes to the tree parser.
+    text_input is the pasted text or a list of its lines; only the start is
+    read, and the same object is then handed to the chosen parser as-is.
+    """
+    if isinstance(text_input, str):
+        head = _input_lines(text_input[:4096])
+    else:
+        head = _input_lines(text_input[:64])
+    
+    first_entry = None
+    nested_tops = set()
+    for line in head:
+        entry = line.strip()
+        if not entry:
+            continue
+        if line[0].isspace() or not _BOX_CHARS.isdisjoint(line):
+            return parse_tree_structure_robust
+        if first_entry is None:
+            first_entry = entry
+        relative = entry.strip('/')
+        if '/' in relative:
+            nested_tops.add(relative.split('/', 1)[0])
+    
+    if not nested_tops:
+        return parse_tree_structure_robust
+    
+    root = first_entry.strip('/')
+    if '/' not in root and _is_folder(first_entry):
+        # Bare root line: only a path list if the nested paths repeat that root
+        return parse_path_list if nested_tops == {root} else parse_tree_structure_robust
+    return parse_path_list
+
 def debug_tree_parsing(text_input):
     """
     Debug function to show how each line is parsed.
     """
-    lines = text_input.strip().split('\n')
+    lines = _input_lines(text_input)
     
-    print("\n🔍 DEBUG PARSING:")
-    print("=" * 60)
+    # Collect the report and print it once instead of once per line
+    report = ["\n🔍 DEBUG PARSING:", "=" * 60]
+    add = report.append
     
     for i, line in enumerate(lines):
         if not line.strip():
@@ -156,75 +278,152 @@ def debug_tree_parsing(text_input):
         
         depth = calculate_tree_depth(line)
         name = extract_clean_name(line)
-        is_folder = name.endswith('/') or ('.' not in name.split('/')[-1]) if name else False
+        is_folder = _is_folder(name) if name else False
         
-        print(f"Line {i:2}: '{line}'")
-        print(f"       Depth: {depth}, Name: '{name}', Is folder: {is_folder}")
+        add(f"Line {i:2}: '{line}'")
+        add(f"       Depth: {depth}, Name: '{name}', Is folder: {is_folder}")
     
-    print("=" * 60)
+    add("=" * 60)
+    print('\n'.join(report))
+
+def _split_operations(operations):
+    """Split operations into (folder_ops, file_ops) in a single pass"""
+    folder_ops = []
+    file_ops = []
+    for op in operations:
+        action = op['action']
+        if action == 'CREATE_FOLDER':
+            folder_ops.append(op)
+        elif action == 'CREATE_FILE':
+            file_ops.append(op)
+    return folder_ops, file_ops
+
+def _create_empty_file(full_path):
+    """Create (or truncate) an empty file without building a text file object for it"""
+    os.close(os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666))
+    return full_path
 
-def create_structure_from_operations(base_path, operations):
+def create_structure_from_operations(base_path, operations, verbose=True):
     """
-    Create folder and file structure from operations list
+    Create folder and file structure from operations list.
+    With verbose, the created paths are reported in one write at the end.
+    Returns a (folders created, files created) tuple.
     """
-    # Sort operations: folders first, then files
-    folder_ops = [op for op in operations if op['action'] == 'CREATE_FOLDER']
-    file_ops = [op for op in operations if op['action'] == 'CREATE_FILE']
-    
-    all_ops = folder_ops + file_ops
-    
-    for op in all_ops:
-        # Convert path to relative path from base
-        rel_path = op['path'].lstrip('/')
-        if rel_path.endswith('/'):
-            rel_path = rel_path.rstrip('/')
+    # Create folders first, then files, without re-checking each action
+    folder_ops, file_ops = _split_operations(operations)
+    
+    # Join the base path once; every relative path below is appended to it
+    base_prefix = os.path.join(base_path, '')
+    
+    # Convert paths to full paths from base
+    folder_paths = [base_prefix + op['path'].strip('/') for op in folder_ops]
+    file_paths = [base_prefix + op['path'].strip('/') for op in file_ops]
+    
+    # First pass: collect the directories that actually need makedirs.
+    # A folder is skipped only when the next folder in sorted order lies
+    # inside it, since that folder's makedirs creates it as an ancestor (a
+    # folder whose descendant sorts later, e.g. after 'a/b-x', simply gets
+    # its own makedirs). Each file's parent
+    # directory is ensured once as well, unless it is one of the folders
+    # above: operations built by hand may list files without a folder op
+    # (e.g. directly under base_path), and names can carry their own
+    # sub-path (e.g. 'src/main.py').
+    unique_folders = sorted(set(folder_paths))
+    dir_paths = [full_path for full_path, next_path in zip(unique_folders, unique_folders[1:] + [''])
+                 if not next_path.startswith(full_path + '/')]
+    folder_set = set(folder_paths)
+    for full_path in file_paths:
+        parent_dir = os.path.dirname(full_path)
+        if parent_dir and parent_dir not in folder_set:
+            dir_paths.append(parent_dir)
+    
+    # Buffer the per-node report instead of printing every node. It is
+    # written even if creation fails part-way: folders are listed once all
+    # of them exist, files as each write succeeds.
+    report = []
+    try:
+        for dir_path in dict.fromkeys(dir_paths):
+            os.makedirs(dir_path, exist_ok=True)
         
-        full_path = os.path.join(base_path, rel_path)
+        if verbose:
+            report.extend(f"📁 Created folder: {full_path}" for full_path in folder_paths)
         
-        if op['action'] == 'CREATE_FOLDER':
-            os.makedirs(full_path, exist_ok=True)
-            print(f"📁 Created folder: {full_path}")
+        # Second pass: every parent directory exists now, so the file writes are
+        # independent and can overlap (os.open/os.close release the GIL)
+        if len(file_paths) < _PARALLEL_FILE_THRESHOLD:
+            for full_path in file_paths:
+                _create_empty_file(full_path)
+                if verbose:
+                    report.append(f"📄 Created file: {full_path}")
         else:
-            # Ensure parent directory exists
-            parent_dir = os.path.dirname(full_path)
-            if parent_dir and not os.path.exists(parent_dir):
-                os.makedirs(parent_dir, exist_ok=True)
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_create_empty_file, full_path)
+                           for full_path in file_paths]
             
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write('')  # Create empty file
-            print(f"📄 Created file: {full_path}")
+            # Every write has been submitted and runs even if an earlier one
+            # failed, so report each file that was written (in input order)
+            # and only then raise the first failure
+            first_error = None
+            for future in futures:
+                try:
+                    full_path = future.result()
+                except OSError as e:
+                    if first_error is None:
+                        first_error = e
+                    continue
+                if verbose:
+                    report.append(f"📄 Created file: {full_path}")
+            if first_error is not None:
+                raise first_error
+    finally:
+        if report:
+            sys.stdout.write('\n'.join(report) + '\n')
+    
+    return len(folder_ops), len(file_ops)
 
 def display_operations(operations):
     """Display the operations in a readable format"""
-    print("\n📋 Operations to be performed:")
-    print("-" * 60)
+    # Collect the listing and print it once instead of once per operation
+    report = ["\n📋 Operations to be performed:", "-" * 60]
     
-    folder_ops = [op for op in operations if op['action'] == 'CREATE_FOLDER']
-    file_ops = [op for op in operations if op['action'] == 'CREATE_FILE']
+    folder_ops, file_ops = _split_operations(operations)
     
     if folder_ops:
-        print("\n📁 Folders:")
-        for op in folder_ops:
-            print(f"  {op['action']}: {op['path']} (parent: {op['parentPath'] or 'root'})")
+        report.append("\n📁 Folders:")
+        report.extend(f"  {op['action']}: {op['path']} (parent: {op['parentPath'] or 'root'})"
+                      for op in folder_ops)
     
     if file_ops:
-        print("\n📄 Files:")
-        for op in file_ops:
-            print(f"  {op['action']}: {op['path']} (parent: {op['parentPath'] or 'root'})")
+        report.append("\n📄 Files:")
+        report.extend(f"  {op['action']}: {op['path']} (parent: {op['parentPath'] or 'root'})"
+                      for op in file_ops)
     
-    print(f"\n📊 Total: {len(folder_ops)} folders, {len(file_ops)} files")
-    print("-" * 60)
+    report.append(f"\n📊 Total: {len(folder_ops)} folders, {len(file_ops)} files")
+    report.append("-" * 60)
+    print('\n'.join(report))
 
-def main_robust():
+def _remove_staged_folder(staged):
+    """Delete a folder moved aside for overwriting, reporting failures instead of raising"""
+    import shutil
+    try:
+        shutil.rmtree(staged)
+    except OSError as e:
+        print(f"⚠️  Could not remove old copy at '{os.path.abspath(staged)}': {e}")
+
+def main_robust(parser_fn=None, verbose=True):
     """
-    Main function using the robust tree parser
+    Main interactive function.
+    parser_fn forces a parser (e.g. parse_path_list); by default it is
+    detected from the input. verbose=False skips the per-node creation
+    report and prints only the summary.
     """
     print("=" * 60)
-    print("🎯 FOLDER STRUCTURE GENERATOR (Robust Tree Parser)")
+    print("🎯 FOLDER STRUCTURE GENERATOR")
     print("=" * 60)
     
     # Get the folder structure from user
-    print("\n📝 Paste your folder structure (using tree format):")
+    print("\n📝 Paste your folder structure (tree format or one path per line):")
     print("Example:")
     print("project/")
     print("├── src/")
@@ -244,9 +443,8 @@ def main_robust():
         except EOFError:
             break
     
-    folder_structure_text = '\n'.join(lines)
-    
-    if not folder_structure_text.strip():
+    # The parsers take the lines as-is, no need to join them back into one string
+    if not any(line.strip() for line in lines):
         print("❌ No folder structure provided. Exiting.")
         return
     
@@ -261,12 +459,19 @@ def main_robust():
     show_debug = input().strip().lower()
     
     if show_debug == 'y':
-        debug_tree_parsing(folder_structure_text)
+        debug_tree_parsing(lines)
     
     # Parse the structure using the robust algorithm
-    print("\n⏳ Parsing folder structure...")
     try:
-        result = parse_tree_structure_robust(folder_structure_text)
+        # Detect the input format once, then run that parser over every line
+        parser = parser_fn or _pick_parser(lines)
+        if parser is parse_path_list:
+            print("\n⏳ Parsing folder structure (path list)...")
+        elif parser is parse_tree_structure_robust:
+            print("\n⏳ Parsing folder structure (tree format)...")
+        else:
+            print("\n⏳ Parsing folder structure...")
+        result = parser(lines)
         operations = result['operations']
         
         if not operations:
@@ -285,23 +490,32 @@ def main_robust():
                 return
             # Remove existing folder
             import shutil
-            shutil.rmtree(main_folder)
+            if os.path.isdir(main_folder) and not os.path.islink(main_folder):
+                # Move it aside (near-instant on the same filesystem) and
+                # delete it in the background while the new one is created.
+                # Not a daemon thread, so the interpreter waits for it on exit.
+                import threading
+                import uuid
+                staged = f"{os.path.normpath(main_folder)}.old.{uuid.uuid4().hex[:8]}"
+                try:
+                    os.rename(main_folder, staged)
+                except OSError:
+                    shutil.rmtree(main_folder)
+                else:
+                    threading.Thread(target=_remove_staged_folder, args=(staged,)).start()
+            else:
+                shutil.rmtree(main_folder)
         
         # Create the structure
         print(f"\n🚀 Creating folder structure in '{main_folder}'...")
         print("-" * 50)
         
-        create_structure_from_operations(main_folder, operations)
+        folder_count, file_count = create_structure_from_operations(main_folder, operations, verbose)
         
         print("-" * 50)
         print(f"✅ Successfully created folder structure in '{main_folder}'!")
         print(f"📊 Summary:")
         print(f"   Location: {os.path.abspath(main_folder)}")
-        
-        # Count files and folders
-        file_count = len([op for op in operations if op['action'] == 'CREATE_FILE'])
-        folder_count = len([op for op in operations if op['action'] == 'CREATE_FOLDER'])
-        
         print(f"   Folders created: {folder_count}")
         print(f"   Files created: {file_count}")
         
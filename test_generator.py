@@ -0,0 +1,113 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import generator
+
+
+class CreateStructureTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self._tmp.name, 'out')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_file_without_folder_op_creates_base_path(self):
+        operations = [{'action': 'CREATE_FILE', 'name': 'a.txt', 'path': '/a.txt', 'parentPath': '/'}]
+        with redirect_stdout(io.StringIO()):
+            counts = generator.create_structure_from_operations(self.base, operations)
+        self.assertEqual(counts, (0, 1))
+        self.assertTrue(os.path.isfile(os.path.join(self.base, 'a.txt')))
+
+    def test_file_name_with_sub_path(self):
+        result = generator.parse_tree_structure_robust("proj/\n└── src/main.py")
+        with redirect_stdout(io.StringIO()):
+            generator.create_structure_from_operations(self.base, result['operations'])
+        self.assertTrue(os.path.isfile(os.path.join(self.base, 'proj', 'src', 'main.py')))
+
+    def assertReportedFoldersExist(self, operations):
+        with redirect_stdout(io.StringIO()) as out:
+            generator.create_structure_from_operations(self.base, operations)
+        reported = [line.split(': ', 1)[1] for line in out.getvalue().splitlines()
+                    if line.startswith('📁 Created folder')]
+        self.assertTrue(reported)
+        for folder in reported:
+            self.assertTrue(os.path.isdir(folder), folder)
+
+    def test_reported_folders_exist_for_duplicate_paths(self):
+        result = generator.parse_tree_structure_robust("p/\n└── /")
+        self.assertReportedFoldersExist(result['operations'])
+
+    def test_reported_folders_exist_for_unrelated_parent_path(self):
+        operations = [
+            {'action': 'CREATE_FOLDER', 'name': 'docs', 'path': '/docs/', 'parentPath': '/'},
+            {'action': 'CREATE_FOLDER', 'name': 'api', 'path': '/p/api/', 'parentPath': '/docs/'},
+            {'action': 'CREATE_FOLDER', 'name': 'b', 'path': '/a/b/', 'parentPath': '/a/'},
+            {'action': 'CREATE_FOLDER', 'name': 'b-x', 'path': '/a/b-x/', 'parentPath': '/a/'},
+            {'action': 'CREATE_FOLDER', 'name': 'c', 'path': '/a/b/c/', 'parentPath': '/a/b/'},
+        ]
+        self.assertReportedFoldersExist(operations)
+
+    def test_parallel_write_failure_still_reports_written_files(self):
+        operations = [{'action': 'CREATE_FILE', 'name': f'f{i}.txt', 'path': f'/f{i}.txt', 'parentPath': '/'}
+                      for i in range(40)]
+        real_create = generator._create_empty_file
+
+        def create(full_path):
+            if full_path.endswith('f5.txt'):
+                raise PermissionError(13, 'Permission denied', full_path)
+            return real_create(full_path)
+
+        with mock.patch.object(generator, '_create_empty_file', create), \
+                redirect_stdout(io.StringIO()) as out:
+            with self.assertRaises(PermissionError):
+                generator.create_structure_from_operations(self.base, operations)
+        self.assertEqual(out.getvalue().count('Created file'), 39)
+        self.assertNotIn('f5.txt', out.getvalue())
+
+
+class PathListTests(unittest.TestCase):
+    def test_flat_list_creates_files_in_base_path(self):
+        result = generator.parse_path_list("README.md\nsetup.py")
+        self.assertEqual(result['structure']['name'], 'project')
+        with tempfile.TemporaryDirectory() as tmp:
+            base = os.path.join(tmp, 'out')
+            with redirect_stdout(io.StringIO()):
+                counts = generator.create_structure_from_operations(base, result['operations'])
+            self.assertEqual(counts, (0, 2))
+            self.assertEqual(sorted(os.listdir(base)), ['README.md', 'setup.py'])
+
+    def test_root_is_taken_from_a_folder_entry(self):
+        result = generator.parse_path_list("README.md\nsrc/main.py")
+        self.assertEqual(result['structure'], {'name': 'src', 'path': '/src/', 'type': 'folder'})
+
+    def test_pick_parser_accepts_text_and_lines(self):
+        lines = ["project/src/main.py", "project/README.md"]
+        self.assertIs(generator._pick_parser(lines), generator.parse_path_list)
+        self.assertIs(generator._pick_parser('\n'.join(lines)), generator.parse_path_list)
+        self.assertIs(generator._pick_parser("proj/\n└── a.py"), generator.parse_tree_structure_robust)
+
+    def test_pick_parser_keeps_unindented_listing_under_root(self):
+        text = "project/\nsrc/main.py\nREADME.md"
+        self.assertIs(generator._pick_parser(text), generator.parse_tree_structure_robust)
+        paths = [op['path'] for op in generator.parse_tree_structure_robust(text)['operations']]
+        self.assertEqual(paths, ['/project/', '/project/src/main.py', '/project/README.md'])
+        self.assertIs(generator._pick_parser("project/\nproject/src/main.py\nproject/README.md"),
+                      generator.parse_path_list)
+
+
+class OverwriteTests(unittest.TestCase):
+    def test_failed_background_removal_is_reported(self):
+        error = PermissionError(13, 'Permission denied')
+        with mock.patch('shutil.rmtree', side_effect=error), redirect_stdout(io.StringIO()) as out:
+            generator._remove_staged_folder('out.old.1234abcd')
+        self.assertIn('Could not remove old copy', out.getvalue())
+        self.assertIn(os.path.abspath('out.old.1234abcd'), out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()